@@ -0,0 +1,389 @@
+"""
+수업 준비 큐: 수업에 쓸 영상을 미리 등록해 두면 백그라운드 작업자가
+댓글 · 자막 · 요약 · 워드클라우드 빈도 · 썸네일을 미리 받아 둡니다.
+
+- 준비는 수업 시작 WARM_LEAD 전에 시작하고, 결과는 수업이 끝날 때까지 보관합니다.
+- 결과는 프로세스 전체에서 공유되는 저장소에 보관되고, 각 페이지는 get_warm()으로 먼저 확인합니다.
+- YouTube Data API 사용량은 하루 예산(단위) 안에서만 씁니다. (댓글 1페이지 = 1단위, 제목 = 1단위)
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from youtube_tools import (
+    DEFAULT_USER_STOPWORDS,
+    download_thumbnail,
+    get_video_title,
+    get_video_transcript,
+    iter_comment_pages,
+    parse_stopwords,
+    summarize_with_openai,
+    wordcloud_frequencies,
+)
+
+MAX_WORKERS = 3
+DEFAULT_QUOTA_BUDGET = 200
+WARM_TTL = 12 * 3600                # 미리 받아 둔 결과를 쓰는 최소 시간 (초)
+WARM_LEAD = timedelta(hours=2)      # 수업 시작 몇 시간 전부터 준비를 시작할지
+LESSON_MARGIN = timedelta(hours=3)  # 수업 시작 뒤에도 결과를 보관하는 시간
+
+# 수업 시각은 한국 시간 기준, YouTube API 할당량은 태평양 시간 자정에 초기화됩니다.
+KST = timezone(timedelta(hours=9), "KST")
+QUOTA_TZ = ZoneInfo("America/Los_Angeles")
+
+STEPS = ["댓글", "워드클라우드", "썸네일", "자막", "요약"]
+
+# 단계 상태
+PENDING = "대기"
+RUNNING = "진행 중"
+DONE = "완료"
+SKIPPED = "건너뜀"
+FAILED = "실패"
+EXPIRED = "만료"
+OPTED_OUT = "사용 안 함"   # 사용자가 고르지 않은 단계 (다시 등록해도 새로 받지 않음)
+
+# 작업 상태
+SCHEDULED = "scheduled"
+ACTIVE = "active"
+FINISHED = "finished"
+
+_lock = threading.Lock()
+_store = {}   # (종류, 키) → (만료 시각 epoch, 값)
+_jobs = {}    # video_id → 작업 상태 dict
+_quota = {"budget": DEFAULT_QUOTA_BUDGET, "used": 0, "day": None}
+_executor = None
+
+
+# -----------------------------
+# 1. 미리 받아 둔 결과 저장소
+# -----------------------------
+def put_warm(kind, key, value):
+    now = time.time()
+    with _lock:
+        # 저장할 때마다 보관 시간이 지난 결과를 정리해 메모리에 쌓이지 않게 합니다.
+        for store_key in [k for k, (expires, _) in _store.items() if now > expires]:
+            del _store[store_key]
+        _store[(kind, key)] = (now + WARM_TTL, value)
+
+
+def get_warm(kind, key):
+    """
+    미리 받아 둔 결과를 돌려줍니다. 없거나 보관 시간이 지났으면 (지우고) None.
+    """
+    with _lock:
+        entry = _store.get((kind, key))
+        if entry is not None and time.time() > entry[0]:
+            del _store[(kind, key)]
+            entry = None
+    if entry is None:
+        return None
+    return entry[1]
+
+
+def get_warm_comments(video_id, max_pages):
+    """
+    미리 받아 둔 댓글 중 앞쪽 max_pages 페이지를 새 dict 목록으로 돌려줍니다.
+    받아 둔 페이지가 부족하면 (마지막 페이지까지 다 받은 경우가 아니라면) None.
+    """
+    warm = get_warm("comments", video_id)
+    if warm is None:
+        return None
+    if len(warm["pages"]) < max_pages and not warm["complete"]:
+        return None
+    return [dict(c) for page in warm["pages"][:max_pages] for c in page]
+
+
+def _extend_warm(video_id, expires_at):
+    # 이 영상의 결과를 적어도 expires_at까지 보관 (워드클라우드 키는 (video_id, ...) 튜플)
+    with _lock:
+        for store_key, (expires, value) in _store.items():
+            key = store_key[1]
+            if (key[0] if isinstance(key, tuple) else key) == video_id and expires < expires_at:
+                _store[store_key] = (expires_at, value)
+
+
+# -----------------------------
+# 2. API 사용량 예산 (하루 단위)
+# -----------------------------
+def _reset_quota_if_new_day():
+    # _lock을 잡은 상태에서 부릅니다.
+    today = datetime.now(QUOTA_TZ).date()
+    if _quota["day"] != today:
+        _quota["day"] = today
+        _quota["used"] = 0
+
+
+def set_quota_budget(budget):
+    with _lock:
+        _quota["budget"] = budget
+
+
+def quota_status():
+    with _lock:
+        _reset_quota_if_new_day()
+        return dict(_quota)
+
+
+def _spend_quota(units=1):
+    with _lock:
+        _reset_quota_if_new_day()
+        if _quota["used"] + units > _quota["budget"]:
+            return False
+        _quota["used"] += units
+        return True
+
+
+# -----------------------------
+# 3. 작업 등록 / 상태 조회
+# -----------------------------
+def register_video(video_id, lesson_time, yt_api_key, openai_api_key=None,
+                   max_pages=5, with_summary=True):
+    """
+    영상을 큐에 올리고 수업 시작 WARM_LEAD 전에 백그라운드 준비를 시작합니다.
+    (이미 그 시각이 지났으면 바로 시작)
+
+    이미 등록된 영상을 다시 등록하면:
+      - 준비 중이면 수업 시각만 바꿉니다.
+      - 실패/건너뛴 단계가 있거나 결과가 만료됐으면 처음부터 다시 준비합니다.
+        ("사용 안 함"인 요약은 이번에 요약을 요청한 경우에만 다시 준비할 이유가 됩니다.)
+      - 그 밖에는 결과를 새 수업 시각까지 보관하도록 늘립니다.
+    """
+    keep_until = (lesson_time + LESSON_MARGIN).timestamp()
+    summary_key = openai_api_key if with_summary else None
+
+    with _lock:
+        job = _jobs.get(video_id)
+        if job is not None and job["state"] == ACTIVE:
+            job["lesson_time"] = lesson_time
+            return job
+        if job is not None and job["state"] == FINISHED and not _needs_rerun(job, summary_key is not None):
+            job["lesson_time"] = lesson_time
+            job["expires_at"] = max(job["expires_at"], keep_until)
+            expires_at = job["expires_at"]
+        else:
+            expires_at = None
+            if job is None:
+                job = _jobs[video_id] = {"video_id": video_id, "title": None, "generation": 0}
+            elif job.get("timer") is not None:
+                job["timer"].cancel()
+            job.update(
+                lesson_time=lesson_time,
+                warm_at=lesson_time - WARM_LEAD,
+                max_pages=max_pages,
+                args=(yt_api_key, summary_key),
+                state=SCHEDULED,
+                expires_at=None,
+                timer=None,
+                steps={step: PENDING for step in STEPS},
+                messages={},
+                generation=job["generation"] + 1,
+            )
+            generation = job["generation"]
+
+    if expires_at is not None:
+        _extend_warm(video_id, expires_at)
+        return job
+
+    delay = (job["warm_at"] - datetime.now(KST)).total_seconds()
+    if delay <= 0:
+        _start_job(job, generation)
+    else:
+        timer = threading.Timer(delay, _start_job, args=(job, generation))
+        timer.daemon = True
+        with _lock:
+            job["timer"] = timer
+        timer.start()
+    return job
+
+
+def list_jobs():
+    """
+    수업 시각 순으로 정렬된 작업 상태의 복사본 목록
+    (보관 시간이 지난 작업은 "완료" 단계가 "만료"로 표시됩니다.)
+    """
+    now = time.time()
+    with _lock:
+        jobs = []
+        for job in _jobs.values():
+            expired = job["state"] == FINISHED and now > job["expires_at"]
+            jobs.append({
+                "video_id": job["video_id"],
+                "title": job["title"],
+                "lesson_time": job["lesson_time"],
+                "warm_at": job["warm_at"],
+                "state": job["state"],
+                "steps": {
+                    step: EXPIRED if expired and status == DONE else status
+                    for step, status in job["steps"].items()
+                },
+                "messages": dict(job["messages"]),
+            })
+    return sorted(jobs, key=lambda j: j["lesson_time"])
+
+
+def remove_video(video_id):
+    # 예약된 작업은 취소하고, 진행 중인 작업은 끝까지 돌지만 목록에서는 바로 빠집니다.
+    with _lock:
+        job = _jobs.pop(video_id, None)
+        if job is not None:
+            job["generation"] += 1
+            if job.get("timer") is not None:
+                job["timer"].cancel()
+
+
+def job_progress(job):
+    finished = sum(
+        1 for s in job["steps"].values() if s in (DONE, SKIPPED, FAILED, EXPIRED, OPTED_OUT)
+    )
+    return finished / len(STEPS)
+
+
+def _needs_rerun(job, want_summary):
+    # _lock을 잡은 상태에서 부릅니다.
+    return (
+        any(s in (FAILED, SKIPPED) for s in job["steps"].values())
+        or (want_summary and job["steps"]["요약"] == OPTED_OUT)
+        or time.time() > job["expires_at"]
+    )
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="lesson-queue")
+        return _executor
+
+
+def _start_job(job, generation):
+    # 그 사이 다시 예약되었거나 목록에서 빠진 작업이면 무시
+    with _lock:
+        if job["generation"] != generation or job["state"] != SCHEDULED:
+            return
+        job["state"] = ACTIVE
+        job["timer"] = None
+    _get_executor().submit(_run_job, job)
+
+
+def _set_step(job, step, status, message=None):
+    with _lock:
+        job["steps"][step] = status
+        if message:
+            job["messages"][step] = message
+
+
+# -----------------------------
+# 4. 작업자 (영상 하나 준비)
+# -----------------------------
+def _run_job(job):
+    """
+    영상 하나를 준비합니다. 예상하지 못한 오류가 나도 "진행 중"으로 멈춰 있지 않도록
+    진행 중인 단계는 실패, 남은 단계는 건너뜀으로 표시하고 작업을 끝냅니다.
+    """
+    try:
+        _warm_video(job, *job["args"])
+    except Exception as e:
+        with _lock:
+            for step, status in job["steps"].items():
+                if status == RUNNING:
+                    job["steps"][step] = FAILED
+                    job["messages"][step] = str(e)
+                elif status == PENDING:
+                    job["steps"][step] = SKIPPED
+    finally:
+        # 결과는 WARM_TTL 또는 수업 시작 + LESSON_MARGIN 중 더 늦은 때까지 보관
+        with _lock:
+            expires_at = max(
+                time.time() + WARM_TTL,
+                (job["lesson_time"] + LESSON_MARGIN).timestamp(),
+            )
+            job["expires_at"] = expires_at
+            job["state"] = FINISHED
+        _extend_warm(job["video_id"], expires_at)
+
+
+def _warm_video(job, yt_api_key, openai_api_key):
+    video_id = job["video_id"]
+
+    # 1) 댓글 → 워드클라우드 빈도 (페이지를 요청하기 전에 예산 1단위씩 차감)
+    _set_step(job, "댓글", RUNNING)
+    pages, complete = [], False
+    page_iter = iter_comment_pages(yt_api_key, video_id, job["max_pages"])
+    try:
+        while not complete and len(pages) < job["max_pages"] and _spend_quota():
+            page, complete = next(page_iter, ([], True))
+            pages.append(page)
+    except Exception as e:
+        _set_step(job, "댓글", FAILED, str(e))
+        pages = []
+
+    if not pages:
+        if job["steps"]["댓글"] == RUNNING:
+            _set_step(job, "댓글", SKIPPED, "API 예산이 부족합니다.")
+        _set_step(job, "워드클라우드", SKIPPED)
+    else:
+        put_warm("comments", video_id, {"pages": pages, "complete": complete})
+        partial = len(pages) < job["max_pages"] and not complete
+        _set_step(job, "댓글", DONE, "API 예산이 부족해 일부만 받았습니다." if partial else None)
+
+        # 일부만 받았으면 워드클라우드 페이지가 요청한 페이지 수와 맞지 않으므로 만들지 않음
+        # (get_warm_comments와 같은 기준)
+        if partial:
+            _set_step(job, "워드클라우드", SKIPPED, "댓글을 일부만 받아 미리 만들지 않았습니다.")
+        else:
+            _set_step(job, "워드클라우드", RUNNING)
+            stopwords = parse_stopwords(DEFAULT_USER_STOPWORDS)
+            texts = [c["text"] for page in pages for c in page]
+            freqs = wordcloud_frequencies(texts, stopwords)
+            if freqs:
+                put_warm("wordcloud", (video_id, job["max_pages"], frozenset(stopwords)), freqs)
+                _set_step(job, "워드클라우드", DONE)
+            else:
+                _set_step(job, "워드클라우드", SKIPPED, "댓글이 없습니다.")
+
+    # 2) 썸네일
+    _set_step(job, "썸네일", RUNNING)
+    try:
+        image = download_thumbnail(video_id)
+    except Exception as e:
+        _set_step(job, "썸네일", FAILED, str(e))
+    else:
+        if image is None:
+            _set_step(job, "썸네일", FAILED, "썸네일 이미지를 불러올 수 없습니다.")
+        else:
+            put_warm("thumbnail", video_id, image)
+            _set_step(job, "썸네일", DONE)
+
+    # 3) 자막 → 요약
+    _set_step(job, "자막", RUNNING)
+    try:
+        transcript = get_video_transcript(video_id)
+    except RuntimeError as e:
+        _set_step(job, "자막", FAILED, str(e))
+        _set_step(job, "요약", SKIPPED)
+        return
+    put_warm("transcript", video_id, transcript)
+    _set_step(job, "자막", DONE)
+
+    if not openai_api_key:
+        _set_step(job, "요약", OPTED_OUT, "요약 미리 만들기를 선택하지 않았습니다.")
+        return
+
+    _set_step(job, "요약", RUNNING)
+    try:
+        title = get_video_title(yt_api_key, video_id) if _spend_quota() else None
+    except Exception:
+        title = None
+    with _lock:
+        job["title"] = title
+    if title:
+        put_warm("title", video_id, title)
+    try:
+        summary = summarize_with_openai(openai_api_key, transcript, title)
+    except Exception as e:
+        _set_step(job, "요약", FAILED, str(e))
+        return
+    put_warm("summary", video_id, summary)
+    _set_step(job, "요약", DONE)
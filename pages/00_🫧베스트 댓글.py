@@ -1,6 +1,8 @@
 import streamlit as st
 from googleapiclient.discovery import build
 from urllib.parse import urlparse, parse_qs
+from sentiment import annotate_comments, LABELS
+from lesson_queue import get_warm_comments
 
 # -----------------------------
 # YouTube 영상 ID 추출 함수
@@ -15,31 +17,52 @@ def extract_video_id(url):
     except:
         return None
 
+# -----------------------------
+# 정렬 기준 (화면 표시 이름 → (댓글 키, 내림차순 여부))
+# -----------------------------
+SORT_OPTIONS = {
+    "좋아요 많은 순": ("likes", True),
+    "긍정 점수 높은 순": ("sentiment", True),
+    "부정 점수 높은 순": ("sentiment", False),
+}
+
 # -----------------------------
 # YouTube 댓글 불러오기
 # -----------------------------
-def get_top_comments(api_key, video_id, max_results=50, top_n=3):
-    youtube = build('youtube', 'v3', developerKey=api_key)
+def get_top_comments(api_key, video_id, max_results=50, top_n=3,
+                     sort_by="좋아요 많은 순", labels=None):
+    # 수업 준비 큐에서 미리 받아 둔 댓글이 있으면 API를 부르지 않음
+    comments = get_warm_comments(video_id, max_pages=1)
+    if comments is not None:
+        comments = comments[:max_results]
+    else:
+        youtube = build('youtube', 'v3', developerKey=api_key)
+
+        request = youtube.commentThreads().list(
+            part="snippet",
+            videoId=video_id,
+            maxResults=max_results,
+            order="relevance"  # 관련도 높은 순
+        )
 
-    request = youtube.commentThreads().list(
-        part="snippet",
-        videoId=video_id,
-        maxResults=max_results,
-        order="relevance"  # 관련도 높은 순
-    )
+        response = request.execute()
 
-    response = request.execute()
+        comments = []
+        for item in response.get("items", []):
+            snippet = item["snippet"]["topLevelComment"]["snippet"]
+            comments.append({
+                "author": snippet.get("authorDisplayName", "Unknown"),
+                "text": snippet.get("textDisplay", ""),
+                "likes": snippet.get("likeCount", 0)
+            })
 
-    comments = []
-    for item in response.get("items", []):
-        snippet = item["snippet"]["topLevelComment"]["snippet"]
-        comments.append({
-            "author": snippet.get("authorDisplayName", "Unknown"),
-            "text": snippet.get("textDisplay", ""),
-            "likes": snippet.get("likeCount", 0)
-        })
+    # 감정 점수를 붙이고, 선택한 감정(긍정/중립/부정)만 남기기 (아무것도 고르지 않으면 전체)
+    annotate_comments(comments)
+    if labels:
+        comments = [c for c in comments if c["sentiment_label"] in labels]
 
-    comments.sort(key=lambda x: x["likes"], reverse=True)
+    key, reverse = SORT_OPTIONS[sort_by]
+    comments.sort(key=lambda x: x[key], reverse=reverse)
     return comments[:top_n]
 
 # -----------------------------
@@ -53,6 +76,8 @@ api_key = st.secrets.get("YT_API_KEY")
 
 youtube_url = st.text_input("YouTube 영상 URL 입력")
 top_n = st.number_input("몇 개의 댓글을 볼까요?", min_value=1, max_value=50, value=3, step=1)
+sort_by = st.selectbox("정렬 기준", list(SORT_OPTIONS))
+labels = st.multiselect("감정 필터 (비워 두면 전체)", LABELS, default=LABELS)
 
 if st.button("댓글 가져오기"):
     if not api_key:
@@ -63,7 +88,9 @@ if st.button("댓글 가져오기"):
             st.error("유효한 YouTube URL이 아닙니다.")
         else:
             try:
-                top_comments = get_top_comments(api_key, video_id, top_n=top_n)
+                top_comments = get_top_comments(
+                    api_key, video_id, top_n=top_n, sort_by=sort_by, labels=labels
+                )
                 if not top_comments:
                     st.warning("댓글을 찾을 수 없습니다.")
                 else:
@@ -72,6 +99,7 @@ if st.button("댓글 가져오기"):
                         st.markdown(f"### 댓글 {idx}")
                         st.write(f"**작성자:** {c['author']}")
                         st.write(f"**좋아요:** {c['likes']}")
+                        st.write(f"**감정:** {c['sentiment_label']} ({c['sentiment']:+.2f})")
                         st.write(c['text'])
                         st.markdown("---")
             except Exception as e:
@@ -2,6 +2,8 @@ import streamlit as st
 from urllib.parse import urlparse, parse_qs
 import requests
 from io import BytesIO
+from youtube_tools import get_video_thumbnail
+from lesson_queue import get_warm
 
 # -----------------------------
 # YouTube 영상 ID 추출 함수
@@ -16,13 +18,6 @@ def extract_video_id(url):
     except:
         return None
 
-# -----------------------------
-# YouTube 썸네일 URL 가져오기
-# -----------------------------
-def get_video_thumbnail(video_id):
-    # 최대 해상도 썸네일 URL
-    return f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-
 # -----------------------------
 # Streamlit UI
 # -----------------------------
@@ -38,14 +33,19 @@ if st.button("썸네일 가져오기"):
     else:
         thumbnail_url = get_video_thumbnail(video_id)
 
-        # 썸네일 이미지 표시
-        st.image(thumbnail_url, caption="썸네일", use_column_width=True)
+        # 수업 준비 큐에서 미리 받아 둔 이미지가 있으면 그것을 사용
+        image = get_warm("thumbnail", video_id)
+        if image is None:
+            # 이미지 데이터를 실제로 가져오기
+            response = requests.get(thumbnail_url)
+            if response.status_code == 200:
+                image = response.content
 
-        # 이미지 데이터를 실제로 가져오기
-        response = requests.get(thumbnail_url)
+        # 썸네일 이미지 표시
+        st.image(image or thumbnail_url, caption="썸네일", use_column_width=True)
 
-        if response.status_code == 200:
-            img_bytes = BytesIO(response.content)
+        if image is not None:
+            img_bytes = BytesIO(image)
 
             # 다운로드 버튼 생성
             st.download_button(
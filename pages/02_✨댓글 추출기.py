@@ -1,6 +1,9 @@
 import streamlit as st
 from googleapiclient.discovery import build
 from urllib.parse import urlparse, parse_qs
+from sentiment import annotate_comments, LABELS
+from timeline import BIN_OPTIONS, build_timeline, timeline_bins
+from lesson_queue import get_warm_comments
 
 # -----------------------------
 # YouTube 영상 ID 추출 함수 (네가 쓰던 거 그대로 재사용)
@@ -15,10 +18,24 @@ def extract_video_id(url):
     except:
         return None
 
+# -----------------------------
+# 정렬 기준 (화면 표시 이름 → (댓글 키, 내림차순 여부))
+# -----------------------------
+SORT_OPTIONS = {
+    "좋아요 많은 순": ("likes", True),
+    "긍정 점수 높은 순": ("sentiment", True),
+    "부정 점수 높은 순": ("sentiment", False),
+}
+
 # -----------------------------
 # YouTube 전체 댓글 불러오기
 # -----------------------------
 def get_all_comments(api_key, video_id, max_pages=5):
+    # 수업 준비 큐에서 미리 받아 둔 댓글이 있으면 API를 부르지 않음
+    warm = get_warm_comments(video_id, max_pages)
+    if warm is not None:
+        return warm
+
     youtube = build('youtube', 'v3', developerKey=api_key)
 
     comments = []
@@ -53,6 +70,30 @@ def get_all_comments(api_key, video_id, max_pages=5):
 
     return comments
 
+# -----------------------------
+# 댓글 활동 타임라인
+# -----------------------------
+# fragment 안의 위젯을 바꾸면 이 부분만 다시 그려지므로 검색 결과는 그대로 남습니다.
+@st.fragment
+def show_timeline(video_id):
+    timeline = st.session_state["timelines"].get(video_id)
+    if timeline is None or timeline["epochs"].size == 0:
+        return
+
+    st.subheader("⏱️ 댓글 활동 타임라인")
+    col1, col2 = st.columns(2)
+    bin_name = col1.radio("구간 크기", list(BIN_OPTIONS), index=len(BIN_OPTIONS) - 1, horizontal=True)
+    window = col2.slider("이동 합계 구간 수", min_value=1, max_value=24, value=1)
+
+    bins = timeline_bins(timeline, BIN_OPTIONS[bin_name], window)
+    st.bar_chart({"시각": bins["time"], "댓글 수": bins["rolling_count"]}, x="시각", y="댓글 수")
+    st.line_chart(
+        {"시각": bins["time"], "좋아요 가중 활동량": bins["rolling_weighted"]},
+        x="시각",
+        y="좋아요 가중 활동량",
+    )
+    st.caption("좋아요 가중 활동량 = 구간 안 댓글들의 (좋아요 + 1) 합 · 시각은 UTC 기준")
+
 # -----------------------------
 # Streamlit UI
 # -----------------------------
@@ -62,6 +103,9 @@ st.write("유튜브 링크와 **검색어**를 입력하면, 해당 단어가 
 # ✅ 기존 베스트 댓글 페이지와 동일하게 secrets 사용!
 api_key = st.secrets.get("YT_API_KEY")
 
+# 영상별 타임라인 캐시 (video_id → build_timeline 결과)
+st.session_state.setdefault("timelines", {})
+
 youtube_url = st.text_input("YouTube 영상 URL 입력")
 keyword = st.text_input("댓글에서 찾을 단어나 문장 입력 (예: 재밌어요, 공감, 욕, 칭찬 등)")
 
@@ -74,6 +118,9 @@ max_pages = st.slider(
     step=1
 )
 
+sort_by = st.selectbox("정렬 기준", list(SORT_OPTIONS))
+labels = st.multiselect("감정 필터 (비워 두면 전체)", LABELS, default=LABELS)
+
 if st.button("댓글 검색하기"):
     if not api_key:
         st.error("API 키가 설정되어 있지 않습니다. Streamlit Secrets에 YT_API_KEY를 추가하세요.")
@@ -91,18 +138,31 @@ if st.button("댓글 검색하기"):
                 if not comments:
                     st.warning("댓글을 찾을 수 없습니다.")
                 else:
-                    # 🔎 검색어 포함된 댓글만 필터
+                    st.session_state["timelines"][video_id] = build_timeline(comments)
+                    show_timeline(video_id)
+
+                    # 🔎 검색어 포함 + 선택한 감정의 댓글만 필터 (감정을 고르지 않으면 전체)
                     key_lower = keyword.lower()
-                    filtered = [
+                    matched = annotate_comments([
                         c for c in comments
                         if key_lower in c["text"].lower()
+                    ])
+                    filtered = [
+                        c for c in matched
+                        if not labels or c["sentiment_label"] in labels
                     ]
 
-                    if not filtered:
+                    if not matched:
                         st.info(f"'{keyword}' 가(이) 포함된 댓글이 없습니다.")
+                    elif not filtered:
+                        st.info(
+                            f"'{keyword}' 가(이) 들어간 댓글 {len(matched)}개 중 "
+                            f"선택한 감정({', '.join(labels)})에 해당하는 댓글이 없습니다."
+                        )
                     else:
-                        # 좋아요 순으로 정렬
-                        filtered.sort(key=lambda x: x["likes"], reverse=True)
+                        # 선택한 기준으로 정렬
+                        sort_key, reverse = SORT_OPTIONS[sort_by]
+                        filtered.sort(key=lambda x: x[sort_key], reverse=reverse)
 
                         st.success(f"'{keyword}' 가(이) 들어간 댓글 {len(filtered)}개를 찾았습니다!")
 
@@ -112,6 +172,7 @@ if st.button("댓글 검색하기"):
                             st.write(f"**작성자:** {c['author']}")
                             st.write(f"**좋아요:** {c['likes']}")
                             st.write(f"**작성 시각:** {c['published_at']}")
+                            st.write(f"**감정:** {c['sentiment_label']} ({c['sentiment']:+.2f})")
                             st.write(c["text"])
 
             except Exception as e:
@@ -6,7 +6,8 @@ from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 from io import BytesIO
 import os
-import re
+from youtube_tools import DEFAULT_USER_STOPWORDS, parse_stopwords, wordcloud_frequencies
+from lesson_queue import get_warm, get_warm_comments
 
 # -----------------------------
 # 1. 유튜브 영상 ID 추출
@@ -25,6 +26,11 @@ def extract_video_id(url):
 # 2. 댓글 불러오기
 # -----------------------------
 def get_all_comments(api_key, video_id, max_pages=5):
+    # 수업 준비 큐에서 미리 받아 둔 댓글이 있으면 API를 부르지 않음
+    warm = get_warm_comments(video_id, max_pages)
+    if warm is not None:
+        return [c["text"] for c in warm]
+
     youtube = build("youtube", "v3", developerKey=api_key)
 
     comments = []
@@ -36,6 +42,7 @@ def get_all_comments(api_key, video_id, max_pages=5):
                 part="snippet",
                 videoId=video_id,
                 maxResults=100,
+                order="relevance",    # 수업 준비 큐(미리 받아 둔 댓글)와 같은 순서
                 textFormat="plainText",
                 pageToken=page_token,
             )
@@ -69,13 +76,7 @@ youtube_url = st.text_input("🎥 YouTube 영상 URL 입력")
 max_pages = st.slider("불러올 댓글 페이지 수 (1페이지=100개)", 1, 10, 5)
 
 # 🔤 불용어(금지단어) 입력 UI
-user_stopwords = st.text_input("🛑 제외하고 싶은 단어(쉼표로 구분)", "ㅋㅋㅋㅋ, ㅋㅋ, 진짜, 그냥, 영상, 사람, 그거")
-
-# 기본 불용어 목록
-default_stopwords = {
-    "영상", "진짜", "그냥", "ㅋㅋㅋㅋ", "ㅋㅋㅋ", "ㅋㅋ", 
-    "그거", "이거", "님", "아니", "근데", "그리고"
-}
+user_stopwords = st.text_input("🛑 제외하고 싶은 단어(쉼표로 구분)", DEFAULT_USER_STOPWORDS)
 
 # -----------------------------
 # 버튼 클릭 시 실행
@@ -90,33 +91,27 @@ if st.button("워드클라우드 만들기"):
         st.error("❌ 올바른 유튜브 링크가 아닙니다.")
         st.stop()
 
-    try:
-        comments = get_all_comments(api_key, video_id, max_pages)
-    except Exception as e:
-        st.error(f"에러 발생: {e}")
-        st.stop()
-
-    if not comments:
-        st.warning("댓글이 없습니다.")
-        st.stop()
+    # 기본 불용어 + 사용자 입력 불용어
+    stopwords = parse_stopwords(user_stopwords)
 
-    # -----------------------------
-    # 3. 텍스트 전처리 + 불용어 제거
-    # -----------------------------
-    text = " ".join(comments)
+    # 수업 준비 큐에서 같은 조건으로 미리 세어 둔 단어 빈도가 있으면 그대로 사용
+    frequencies = get_warm("wordcloud", (video_id, max_pages, frozenset(stopwords)))
 
-    # 정규식으로 특수문자/이모지 제거
-    text = re.sub(r"[^가-힣A-Za-z0-9\s]", " ", text)
-
-    # 사용자 입력 불용어 정리
-    custom_words = set(w.strip() for w in user_stopwords.split(",") if w.strip())
+    if frequencies is None:
+        try:
+            comments = get_all_comments(api_key, video_id, max_pages)
+        except Exception as e:
+            st.error(f"에러 발생: {e}")
+            st.stop()
 
-    # 전체 불용어 조합
-    stopwords = default_stopwords.union(custom_words)
+        if not comments:
+            st.warning("댓글이 없습니다.")
+            st.stop()
 
-    # 불용어 제거 수행
-    for sw in stopwords:
-        text = text.replace(sw, " ")
+        # -----------------------------
+        # 3. 텍스트 전처리 + 불용어 제거 → 단어 빈도
+        # -----------------------------
+        frequencies = wordcloud_frequencies(comments, stopwords)
 
     # -----------------------------
     # 4. 폰트 설정 → MaruBuri (안되면 기본폰트로)
@@ -125,10 +120,10 @@ if st.button("워드클라우드 만들기"):
     wc_kwargs = dict(width=800, height=400, background_color="white")
 
     try:
-        wc = WordCloud(font_path=font_path, **wc_kwargs).generate(text)
+        wc = WordCloud(font_path=font_path, **wc_kwargs).generate_from_frequencies(frequencies)
     except:
         st.warning("⚠️ MaruBuri 폰트를 사용할 수 없어 기본폰트로 생성합니다.")
-        wc = WordCloud(**wc_kwargs).generate(text)
+        wc = WordCloud(**wc_kwargs).generate_from_frequencies(frequencies)
 
     # -----------------------------
     # 5. 워드클라우드 표시
@@ -0,0 +1,162 @@
+import streamlit as st
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from urllib.parse import urlparse, parse_qs
+import time
+from sentiment import annotate_comments, summarize_sentiment, sentiment_by_date, LABELS
+from lesson_queue import get_warm_comments
+
+# -----------------------------
+# 1. 유튜브 영상 ID 추출
+# -----------------------------
+def extract_video_id(url):
+    try:
+        parsed = urlparse(url)
+        if parsed.hostname in ["youtu.be"]:
+            return parsed.path[1:]
+        if parsed.hostname in ["www.youtube.com", "youtube.com"]:
+            return parse_qs(parsed.query).get("v", [None])[0]
+    except:
+        return None
+
+# -----------------------------
+# 2. 댓글 불러오기
+# -----------------------------
+def get_all_comments(api_key, video_id, max_pages=5):
+    # 수업 준비 큐에서 미리 받아 둔 댓글이 있으면 API를 부르지 않음
+    warm = get_warm_comments(video_id, max_pages)
+    if warm is not None:
+        return warm
+
+    youtube = build("youtube", "v3", developerKey=api_key)
+
+    comments = []
+    page_token = None
+
+    for _ in range(max_pages):
+        try:
+            request = youtube.commentThreads().list(
+                part="snippet",
+                videoId=video_id,
+                maxResults=100,
+                order="relevance",    # 수업 준비 큐(미리 받아 둔 댓글)와 같은 순서
+                textFormat="plainText",
+                pageToken=page_token,
+            )
+            response = request.execute()
+
+        except HttpError as e:
+            if e.resp.status == 403:
+                raise RuntimeError("이 영상은 댓글이 비활성화되어 있습니다.")
+            raise
+
+        for item in response.get("items", []):
+            snippet = item["snippet"]["topLevelComment"]["snippet"]
+            comments.append({
+                "author": snippet.get("authorDisplayName", "Unknown"),
+                "text": snippet.get("textDisplay", ""),
+                "likes": snippet.get("likeCount", 0),
+                "published_at": snippet.get("publishedAt", ""),
+            })
+
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+
+    return comments
+
+
+# -----------------------------
+# Streamlit UI
+# -----------------------------
+st.title("💖 YouTube 댓글 감정 분석")
+st.write("댓글을 **긍정 · 중립 · 부정**으로 나누고, 날짜별로 분위기가 어떻게 바뀌는지 보여줍니다.")
+
+api_key = st.secrets.get("YT_API_KEY")
+
+youtube_url = st.text_input("🎥 YouTube 영상 URL 입력")
+max_pages = st.slider("불러올 댓글 페이지 수 (1페이지=100개)", 1, 10, 5)
+
+if st.button("감정 분석하기"):
+    if not api_key:
+        st.error("❌ API 키가 없습니다.")
+        st.stop()
+
+    video_id = extract_video_id(youtube_url)
+    if not video_id:
+        st.error("❌ 올바른 유튜브 링크가 아닙니다.")
+        st.stop()
+
+    try:
+        with st.spinner("댓글을 불러오는 중입니다..."):
+            comments = get_all_comments(api_key, video_id, max_pages)
+    except Exception as e:
+        st.error(f"에러 발생: {e}")
+        st.stop()
+
+    if not comments:
+        st.warning("댓글이 없습니다.")
+        st.stop()
+
+    # -----------------------------
+    # 3. 감정 점수 계산 (한 번에 일괄 처리)
+    # -----------------------------
+    start = time.perf_counter()
+    annotate_comments(comments)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize_sentiment(comments)
+    st.caption(f"댓글 {summary['count']}개를 {elapsed * 1000:.1f}ms 만에 분석했습니다.")
+
+    # -----------------------------
+    # 4. 영상 전체 요약
+    # -----------------------------
+    st.subheader("📊 영상 전체 분위기")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("평균 점수", f"{summary['mean']:+.2f}")
+    col2.metric("좋아요 가중 점수", f"{summary['like_weighted_mean']:+.2f}")
+    col3.metric("긍정 비율", f"{summary['ratios']['긍정'] * 100:.0f}%")
+
+    st.bar_chart(
+        {
+            "감정": LABELS,
+            "댓글 수": [summary["counts"][label] for label in LABELS],
+        },
+        x="감정",
+        y="댓글 수",
+    )
+
+    # -----------------------------
+    # 5. 날짜별 변화
+    # -----------------------------
+    daily = sentiment_by_date(comments)
+    if daily:
+        st.subheader("📈 날짜별 평균 감정 점수")
+        st.line_chart(
+            {
+                "날짜": [d["date"] for d in daily],
+                "평균 점수": [d["mean"] for d in daily],
+            },
+            x="날짜",
+            y="평균 점수",
+        )
+
+    # -----------------------------
+    # 6. 대표 댓글
+    # -----------------------------
+    ranked = sorted(comments, key=lambda x: x["sentiment"], reverse=True)
+    col_pos, col_neg = st.columns(2)
+
+    with col_pos:
+        st.subheader("😊 가장 긍정적인 댓글")
+        for c in ranked[:5]:
+            st.write(f"**{c['author']}** ({c['sentiment']:+.2f}, 👍 {c['likes']})")
+            st.write(c["text"])
+            st.markdown("---")
+
+    with col_neg:
+        st.subheader("😥 가장 부정적인 댓글")
+        for c in reversed(ranked[-5:]):
+            st.write(f"**{c['author']}** ({c['sentiment']:+.2f}, 👍 {c['likes']})")
+            st.write(c["text"])
+            st.markdown("---")
@@ -0,0 +1,127 @@
+import streamlit as st
+from urllib.parse import urlparse, parse_qs
+from datetime import datetime, time
+from lesson_queue import (
+    KST,
+    SCHEDULED,
+    STEPS,
+    DONE,
+    EXPIRED,
+    FAILED,
+    OPTED_OUT,
+    RUNNING,
+    SKIPPED,
+    job_progress,
+    list_jobs,
+    quota_status,
+    register_video,
+    remove_video,
+    set_quota_budget,
+)
+
+# -----------------------------
+# 1. 유튜브 영상 ID 추출
+# -----------------------------
+def extract_video_id(url):
+    try:
+        parsed = urlparse(url)
+        if parsed.hostname in ["youtu.be"]:
+            return parsed.path[1:]
+        if parsed.hostname in ["www.youtube.com", "youtube.com"]:
+            return parse_qs(parsed.query).get("v", [None])[0]
+    except:
+        return None
+
+STEP_ICONS = {DONE: "✅", RUNNING: "⏳", SKIPPED: "⏭️", FAILED: "❌", EXPIRED: "⌛", OPTED_OUT: "➖"}
+
+# -----------------------------
+# 2. 준비 현황 (2초마다 자동 새로고침)
+# -----------------------------
+@st.fragment(run_every="2s")
+def show_status():
+    quota = quota_status()
+    st.progress(
+        min(quota["used"] / quota["budget"], 1.0) if quota["budget"] else 1.0,
+        text=f"오늘 YouTube API 사용량: {quota['used']} / {quota['budget']} 단위",
+    )
+
+    jobs = list_jobs()
+    if not jobs:
+        st.info("아직 등록된 영상이 없습니다.")
+        return
+
+    for job in jobs:
+        with st.container(border=True):
+            title = job["title"] or job["video_id"]
+            st.markdown(f"**{job['lesson_time']:%m월 %d일 %H:%M} 수업** · {title}")
+            if job["state"] == SCHEDULED:
+                st.caption(f"⏰ {job['warm_at']:%m월 %d일 %H:%M}부터 준비를 시작합니다.")
+            st.progress(job_progress(job))
+            st.write(" · ".join(
+                f"{STEP_ICONS.get(job['steps'][step], '🕒')} {step}" for step in STEPS
+            ))
+            for step, message in job["messages"].items():
+                st.caption(f"{step}: {message}")
+            if EXPIRED in job["steps"].values():
+                st.caption("보관 시간이 지났습니다. 다시 등록하면 새로 받아 둡니다.")
+            if st.button("목록에서 빼기", key=f"remove_{job['video_id']}"):
+                remove_video(job["video_id"])
+                st.rerun(scope="fragment")
+
+# -----------------------------
+# Streamlit UI
+# -----------------------------
+st.title("🗓️ 수업 준비 큐")
+st.write(
+    "수업에 쓸 영상을 미리 등록해 두면 **댓글 · 자막 · 요약 · 워드클라우드 · 썸네일**을 "
+    "백그라운드에서 미리 받아 둡니다. 수업 중에는 각 페이지에서 기다림 없이 바로 결과가 나옵니다."
+)
+
+yt_api_key = st.secrets.get("YT_API_KEY")
+openai_api_key = st.secrets.get("OPENAI_API_KEY")
+
+youtube_url = st.text_input("🎥 YouTube 영상 URL 입력")
+col1, col2 = st.columns(2)
+lesson_date = col1.date_input("수업 날짜", value=datetime.now(KST).date())
+lesson_clock = col2.time_input("수업 시각", value=time(9, 0))
+
+max_pages = st.slider("미리 받을 댓글 페이지 수 (1페이지=100개)", 1, 10, 5)
+with_summary = st.checkbox("🤖 AI 요약도 미리 만들기 (OpenAI 사용)", value=True)
+
+# 예산은 모든 사용자가 함께 쓰므로, 값을 직접 바꿨을 때만 저장합니다. (매일 초기화)
+st.number_input(
+    "하루 YouTube API 예산 (단위, 댓글 1페이지 = 1단위)",
+    min_value=1,
+    max_value=10000,
+    value=quota_status()["budget"],
+    step=10,
+    key="quota_budget",
+    on_change=lambda: set_quota_budget(st.session_state["quota_budget"]),
+)
+
+if st.button("➕ 수업 큐에 등록"):
+    if not yt_api_key:
+        st.error("❌ YT_API_KEY가 설정되어 있지 않습니다.")
+        st.stop()
+
+    video_id = extract_video_id(youtube_url)
+    if not video_id:
+        st.error("❌ 올바른 유튜브 URL이 아닙니다.")
+        st.stop()
+
+    if with_summary and not openai_api_key:
+        st.warning("OPENAI_API_KEY가 없어 요약은 미리 만들지 않습니다.")
+
+    register_video(
+        video_id,
+        datetime.combine(lesson_date, lesson_clock, tzinfo=KST),
+        yt_api_key,
+        openai_api_key,
+        max_pages=max_pages,
+        with_summary=with_summary,
+    )
+    st.success("등록했습니다! 아래에서 준비 상황을 확인하세요.")
+
+st.markdown("---")
+st.subheader("📋 준비 현황")
+show_status()
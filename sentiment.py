@@ -0,0 +1,275 @@
+"""
+댓글 감정 분석 엔진 (한국어/영어 극성 사전 기반)
+
+- 극성 사전을 정규식 하나로 미리 컴파일해 두고, 댓글 목록을 한 번에 채점합니다.
+- "안 좋아요", "좋지 않아요", "not good" 같은 부정 표현은 극성을 뒤집습니다.
+- LLM 호출 없이 로컬에서 동작하므로 댓글 수천 개도 1초 안에 처리됩니다.
+
+라벨 점검 + 벤치마크:  python sentiment.py
+"""
+import math
+import re
+import time
+
+# -----------------------------
+# 1. 극성 사전 (단어: 가중치)
+# -----------------------------
+# 한국어는 어간 위주로 적어 두고 부분 일치로 찾습니다. (예: "재밌" → 재밌어요, 재밌다)
+KO_LEXICON = {
+    # 긍정
+    "좋": 1.5, "최고": 2.5, "재밌": 2.0, "재미있": 2.0, "꿀잼": 2.5, "감사": 2.0,
+    "고마": 2.0, "고맙": 2.0, "사랑": 2.0, "멋지": 2.0, "멋있": 2.0, "훌륭": 2.5,
+    "대박": 2.0, "짱": 2.0, "행복": 2.0, "웃기": 1.5, "유익": 2.0, "도움": 1.5,
+    "감동": 2.5, "추천": 1.5, "완벽": 2.5, "예쁘": 1.5, "이쁘": 1.5, "귀엽": 1.5,
+    "신기": 1.0, "기쁘": 2.0, "응원": 1.5, "존경": 2.0, "힐링": 1.5, "천재": 2.0,
+    "쉽게": 1.0, "이해가 잘": 2.0, "잘 봤": 1.5, "잘봤": 1.5,
+    # 부정
+    "싫": -2.0, "별로": -1.5, "최악": -3.0, "노잼": -2.0, "재미없": -2.0,
+    "지루": -1.5, "짜증": -2.5, "화나": -2.0, "슬프": -1.5, "실망": -2.0,
+    "나쁘": -2.0, "나빠": -2.0, "쓰레기": -3.0, "어렵": -1.0, "무섭": -1.0,
+    "불편": -1.5, "혐오": -3.0, "거짓": -2.0, "망했": -2.0, "아쉽": -1.0,
+    "답답": -1.5, "억울": -1.5, "불쌍": -1.0, "역겹": -3.0, "한심": -2.5,
+    "어이없": -2.0, "모르겠": -0.5,
+    # 이모티콘
+    "ㅋㅋ": 0.5, "ㅎㅎ": 0.5, "ㅠㅠ": -0.5, "ㅜㅜ": -0.5,
+    "👍": 1.5, "❤": 2.0, "😍": 2.0, "😊": 1.5, "😢": -1.0, "😡": -2.5, "👎": -2.0,
+}
+
+# 영어는 단어 단위로 일치시킵니다. (대소문자 무시)
+EN_LEXICON = {
+    # positive
+    "good": 1.5, "great": 2.0, "love": 2.5, "loved": 2.5, "loves": 2.5,
+    "awesome": 2.5, "amazing": 2.5, "best": 2.5, "excellent": 2.5, "nice": 1.5,
+    "helpful": 2.0, "thank": 2.0, "thanks": 2.0, "fun": 1.5, "funny": 1.5,
+    "beautiful": 2.0, "cool": 1.5, "perfect": 2.5, "wonderful": 2.5,
+    "interesting": 1.5, "useful": 1.5, "happy": 2.0, "like": 1.0,
+    # negative
+    "bad": -2.0, "worst": -3.0, "hate": -2.5, "hated": -2.5, "boring": -2.0,
+    "terrible": -2.5, "awful": -2.5, "sad": -1.5, "angry": -2.0,
+    "annoying": -2.0, "stupid": -2.0, "wrong": -1.5, "disappointed": -2.0,
+    "disappointing": -2.0, "useless": -2.0, "poor": -1.5, "horrible": -2.5,
+    "fake": -1.5, "confusing": -1.0,
+}
+
+LEXICON = {**KO_LEXICON, **{k.lower(): v for k, v in EN_LEXICON.items()}}
+
+# 점수 라벨 기준 (정규화 점수 -1 ~ 1)
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+LABELS = ["긍정", "중립", "부정"]
+
+# -----------------------------
+# 2. 매처 컴파일 (모듈 로드 시 한 번만)
+# -----------------------------
+def _compile_matcher():
+    # 긴 단어부터 시도해야 "재미없"이 "재미"류보다 먼저 잡힙니다.
+    ko_terms = sorted(KO_LEXICON, key=len, reverse=True)
+    en_terms = sorted(EN_LEXICON, key=len, reverse=True)
+    ko_part = "|".join(re.escape(t) for t in ko_terms)
+    en_part = r"\b(?:" + "|".join(re.escape(t) for t in en_terms) + r")\b"
+    return re.compile(f"{en_part}|{ko_part}", re.IGNORECASE)
+
+
+_MATCHER = _compile_matcher()
+
+# 단어 앞의 부정어: "not good", "don't like", "안 좋아", "못 봤"
+_PRE_NEGATION = re.compile(
+    r"(?:\b(?:not|no|never|hardly)|n't)\s+(?:\w+\s+)?$"
+    r"|(?<![가-힣])(?:안|못)\s?$",
+    re.IGNORECASE,
+)
+# 단어 뒤의 부정어: "좋지 않아요", "재밌지는 않", "좋아하지 마"
+_POST_NEGATION = re.compile(r"^[가-힣]{0,2}지(?:는|도)?\s?(?:않|못|마|말)")
+# "이해가 잘 안 됐어요"처럼 "잘"로 끝나는 구절은 뒤따르는 안/못이 그 구절을 부정합니다.
+# 단, 안/못 바로 뒤에 사전 단어가 오면("잘 안 좋아") 그 단어 쪽에서 한 번만 뒤집습니다.
+_TRAILING_NEGATOR = re.compile(r"\s*(?:안|못)\s+")
+
+_PRE_WINDOW = 20
+_POST_WINDOW = 8
+
+
+# -----------------------------
+# 3. 채점 함수
+# -----------------------------
+def score_text(text):
+    """
+    댓글 하나의 감정 점수를 -1(부정) ~ 1(긍정) 사이 값으로 돌려줍니다.
+    """
+    if not text:
+        return 0.0
+
+    raw = 0.0
+    for m in _MATCHER.finditer(text):
+        weight = LEXICON.get(m.group(0).lower(), 0.0)
+        start, end = m.span()
+        before = text[max(0, start - _PRE_WINDOW):start]
+        after = text[end:end + _POST_WINDOW]
+        if (
+            _PRE_NEGATION.search(before)
+            or _POST_NEGATION.match(after)
+            or _negated_by_trailing(text, m.group(0), end)
+        ):
+            weight = -weight
+        raw += weight
+
+    # 단어가 많아도 -1 ~ 1 범위를 넘지 않도록 정규화 (VADER 방식)
+    return raw / math.sqrt(raw * raw + 15)
+
+
+def _negated_by_trailing(text, term, end):
+    if not term.endswith("잘"):
+        return False
+    neg = _TRAILING_NEGATOR.match(text, end)
+    return neg is not None and _MATCHER.match(text, neg.end()) is None
+
+
+def score_comments(texts):
+    """
+    댓글 텍스트 목록을 한 번에 채점합니다.
+    같은 문장("ㅋㅋㅋ", "감사합니다" 등)은 한 번만 계산합니다.
+    """
+    memo = {}
+    scores = []
+    for text in texts:
+        score = memo.get(text)
+        if score is None:
+            score = memo[text] = score_text(text)
+        scores.append(score)
+    return scores
+
+
+def label_for(score):
+    if score >= POSITIVE_THRESHOLD:
+        return "긍정"
+    if score <= NEGATIVE_THRESHOLD:
+        return "부정"
+    return "중립"
+
+
+def annotate_comments(comments):
+    """
+    댓글 dict 목록에 "sentiment"(점수)와 "sentiment_label"(긍정/중립/부정)을 채워 넣습니다.
+    """
+    scores = score_comments([c.get("text", "") for c in comments])
+    for c, score in zip(comments, scores):
+        c["sentiment"] = score
+        c["sentiment_label"] = label_for(score)
+    return comments
+
+
+# -----------------------------
+# 4. 집계 (영상 단위 / 날짜별)
+# -----------------------------
+def summarize_sentiment(comments):
+    """
+    annotate_comments()를 거친 댓글 목록을 영상 단위로 요약합니다.
+    like_weighted_mean은 좋아요 수(+1)로 가중 평균한 점수입니다.
+    """
+    total = len(comments)
+    counts = {label: 0 for label in LABELS}
+    score_sum = 0.0
+    weighted_sum = 0.0
+    weight_total = 0
+
+    for c in comments:
+        counts[c["sentiment_label"]] += 1
+        score_sum += c["sentiment"]
+        weight = c.get("likes", 0) + 1
+        weighted_sum += c["sentiment"] * weight
+        weight_total += weight
+
+    return {
+        "count": total,
+        "mean": score_sum / total if total else 0.0,
+        "like_weighted_mean": weighted_sum / weight_total if weight_total else 0.0,
+        "counts": counts,
+        "ratios": {label: (n / total if total else 0.0) for label, n in counts.items()},
+    }
+
+
+def sentiment_by_date(comments):
+    """
+    published_at(ISO 8601 문자열)의 날짜 기준으로 댓글 수와 평균 점수를 묶어
+    날짜 순으로 정렬된 리스트를 돌려줍니다.
+    """
+    buckets = {}
+    for c in comments:
+        day = c.get("published_at", "")[:10]
+        if not day:
+            continue
+        entry = buckets.setdefault(day, [0, 0.0])
+        entry[0] += 1
+        entry[1] += c["sentiment"]
+
+    return [
+        {"date": day, "count": n, "mean": total / n}
+        for day, (n, total) in sorted(buckets.items())
+    ]
+
+
+# -----------------------------
+# 5. 라벨 점검 / 벤치마크
+# -----------------------------
+# (문장, 기대 라벨) — 사전이나 부정어 규칙을 고친 뒤 python sentiment.py로 확인합니다.
+_LABEL_CHECKS = [
+    ("이 영상 진짜 유익하고 재밌어요! 감사합니다 ㅎㅎ", "긍정"),
+    ("설명이 너무 지루하고 별로였어요 ㅠㅠ", "부정"),
+    ("좋지 않아요. 광고가 너무 많네요", "부정"),
+    ("안 좋은 예시를 들어서 이해가 잘 안 됐어요", "부정"),
+    ("별로 안 좋아요", "부정"),
+    ("별로 안 재밌어요", "부정"),
+    ("최고 안 보면 손해", "긍정"),
+    ("감사 못 드려서 죄송", "긍정"),
+    ("재밌지는 않았어", "부정"),
+    ("잘 봤습니다", "긍정"),
+    ("This is the best explanation, thanks a lot!", "긍정"),
+    ("Not good, honestly pretty boring", "부정"),
+    ("오늘 수업 시간에 봤습니다", "중립"),
+]
+
+
+def check_labels():
+    """
+    _LABEL_CHECKS 중 기대 라벨과 다르게 나온 (문장, 기대, 실제) 목록을 돌려줍니다.
+    """
+    return [
+        (text, expected, label_for(score_text(text)))
+        for text, expected in _LABEL_CHECKS
+        if label_for(score_text(text)) != expected
+    ]
+
+
+_BENCH_SAMPLES = [
+    "이 영상 진짜 유익하고 재밌어요! 감사합니다 ㅎㅎ",
+    "설명이 너무 지루하고 별로였어요 ㅠㅠ",
+    "좋지 않아요. 광고가 너무 많네요",
+    "안 좋은 예시를 들어서 이해가 잘 안 됐어요",
+    "This is the best explanation, thanks a lot!",
+    "Not good, honestly pretty boring",
+    "ㅋㅋㅋㅋㅋ 선생님 최고",
+    "오늘 수업 시간에 봤습니다",
+]
+
+
+def benchmark(n=50000):
+    """
+    샘플 댓글 n개를 채점해 초당 처리 댓글 수를 돌려줍니다.
+    memo 효과를 빼기 위해 댓글마다 번호를 붙여 모두 다른 문장으로 만듭니다.
+    """
+    texts = [f"{_BENCH_SAMPLES[i % len(_BENCH_SAMPLES)]} #{i}" for i in range(n)]
+    start = time.perf_counter()
+    score_comments(texts)
+    elapsed = time.perf_counter() - start
+    return n / elapsed if elapsed else float("inf")
+
+
+if __name__ == "__main__":
+    mismatches = check_labels()
+    for text, expected, actual in mismatches:
+        print(f"라벨 불일치: {text!r} → {actual} (기대: {expected})")
+    if mismatches:
+        raise SystemExit(1)
+    print(f"라벨 점검 {len(_LABEL_CHECKS)}개 통과")
+
+    for size in (1000, 10000, 50000):
+        print(f"{size:>6}개 댓글: {benchmark(size):,.0f} comments/sec")
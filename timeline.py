@@ -0,0 +1,125 @@
+"""
+댓글 활동 타임라인 (NumPy 벡터 연산)
+
+- publishedAt 문자열 목록을 한 번에 정수 epoch(초) 배열로 바꿉니다.
+- 시간/일 단위 구간 나누기와 이동 합계를 반복문 없이 배열 연산으로 계산합니다.
+- 영상별로 파싱 결과와 구간 집계를 캐시해 두어, 구간 크기를 바꿔도 다시 계산하지 않습니다.
+"""
+import warnings
+from datetime import datetime, timezone
+
+import numpy as np
+
+# 화면 표시 이름 → 구간 길이(초)
+BIN_OPTIONS = {
+    "1시간": 3600,
+    "6시간": 6 * 3600,
+    "1일": 86400,
+}
+
+_NAT = np.iinfo(np.int64).min
+
+
+# -----------------------------
+# 1. 시각 파싱 (문자열 → epoch 초)
+# -----------------------------
+def parse_timestamps(published_at):
+    """
+    ISO 8601 문자열("2024-05-01T12:34:56Z") 목록을 int64 epoch(초) 배열로 바꿉니다.
+    비어 있거나 읽을 수 없는 값은 결과에서 빠지도록 mask로 함께 돌려줍니다.
+    """
+    raw = np.asarray(published_at, dtype=str)
+    if raw.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=bool)
+
+    # numpy는 시간대 표기(Z)를 받지 않으므로 떼고 UTC로 해석합니다.
+    # 이상한 값이나 "+09:00" 같은 오프셋이 섞여 있으면 하나씩 읽는 느린 경로로 넘어갑니다.
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            epochs = np.char.rstrip(raw, "Z").astype("datetime64[s]").astype(np.int64)
+    except (ValueError, Warning):
+        epochs = np.fromiter((_parse_one(s) for s in raw), dtype=np.int64, count=raw.size)
+    return epochs, epochs != _NAT
+
+
+def _parse_one(value):
+    # 읽을 수 없으면 NaT, 시간대가 없으면 UTC로 봅니다.
+    try:
+        stamp = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return _NAT
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return int(stamp.timestamp())
+
+
+# -----------------------------
+# 2. 구간 집계 / 이동 합계
+# -----------------------------
+def bin_activity(epochs, likes, bin_seconds):
+    """
+    댓글을 bin_seconds 길이의 구간으로 나눠
+    (구간 시작 epoch, 댓글 수, 좋아요 가중 활동량) 배열을 돌려줍니다.
+    좋아요 가중 활동량은 구간 안 댓글들의 (좋아요 + 1) 합입니다.
+    """
+    if epochs.size == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float64)
+
+    start = epochs.min() // bin_seconds * bin_seconds
+    idx = (epochs - start) // bin_seconds
+    counts = np.bincount(idx)
+    weighted = np.bincount(idx, weights=likes + 1.0)
+    bin_starts = start + np.arange(counts.size, dtype=np.int64) * bin_seconds
+    return bin_starts, counts, weighted
+
+
+def rolling_sum(values, window):
+    """
+    뒤쪽 window개 구간의 이동 합계 (앞부분은 있는 구간까지만 더함)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if window <= 1 or values.size == 0:
+        return values
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    ends = np.arange(1, values.size + 1)
+    return csum[ends] - csum[np.maximum(ends - window, 0)]
+
+
+# -----------------------------
+# 3. 영상별 타임라인 (캐시 포함)
+# -----------------------------
+def build_timeline(comments):
+    """
+    댓글 dict 목록에서 published_at / likes를 한 번만 파싱해 둡니다.
+    돌려받은 dict를 영상별로 보관해 두고 timeline_bins()에 넘기면 됩니다.
+    """
+    epochs, valid = parse_timestamps([c.get("published_at", "") for c in comments])
+    likes = np.fromiter((c.get("likes", 0) for c in comments), dtype=np.int64, count=len(comments))
+    return {
+        "epochs": epochs[valid],
+        "likes": likes[valid],
+        "bins": {},
+    }
+
+
+def timeline_bins(timeline, bin_seconds, window=1):
+    """
+    build_timeline() 결과를 구간별로 집계합니다. 같은 (구간, 이동창) 조합은 캐시에서 꺼냅니다.
+    """
+    key = (bin_seconds, window)
+    cached = timeline["bins"].get(key)
+    if cached is not None:
+        return cached
+
+    bin_starts, counts, weighted = bin_activity(timeline["epochs"], timeline["likes"], bin_seconds)
+    result = {
+        "time": bin_starts.astype("datetime64[s]"),
+        "count": counts,
+        "weighted": weighted,
+        "rolling_count": rolling_sum(counts, window),
+        "rolling_weighted": rolling_sum(weighted, window),
+    }
+    timeline["bins"][key] = result
+    return result
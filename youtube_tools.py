@@ -0,0 +1,215 @@
+"""
+여러 페이지와 수업 준비 큐(lesson_queue)가 함께 쓰는 YouTube / OpenAI 가져오기 함수 모음
+"""
+import re
+
+import requests
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+from openai import OpenAI
+from wordcloud import WordCloud
+
+# -----------------------------
+# 1. 댓글 (페이지 단위)
+# -----------------------------
+def iter_comment_pages(api_key, video_id, max_pages=5):
+    """
+    댓글을 한 페이지(최대 100개)씩 돌려주는 제너레이터입니다.
+    마지막 페이지까지 다 읽으면 멈춥니다. (관련도 순 — 댓글을 가져오는 모든 페이지와 같은 순서)
+    """
+    youtube = build("youtube", "v3", developerKey=api_key)
+    page_token = None
+
+    for _ in range(max_pages):
+        try:
+            response = youtube.commentThreads().list(
+                part="snippet",
+                videoId=video_id,
+                maxResults=100,
+                order="relevance",
+                textFormat="plainText",
+                pageToken=page_token,
+            ).execute()
+        except HttpError as e:
+            if e.resp.status == 403:
+                raise RuntimeError("이 영상은 댓글이 비활성화되어 있습니다.")
+            raise
+
+        page = []
+        for item in response.get("items", []):
+            snippet = item["snippet"]["topLevelComment"]["snippet"]
+            page.append({
+                "author": snippet.get("authorDisplayName", "Unknown"),
+                "text": snippet.get("textDisplay", ""),
+                "likes": snippet.get("likeCount", 0),
+                "published_at": snippet.get("publishedAt", ""),
+            })
+
+        page_token = response.get("nextPageToken")
+        yield page, page_token is None
+
+        if not page_token:
+            break
+
+# -----------------------------
+# 2. 영상 정보 (제목)
+# -----------------------------
+def get_video_title(api_key, video_id):
+    try:
+        youtube = build("youtube", "v3", developerKey=api_key)
+        request = youtube.videos().list(
+            part="snippet",
+            id=video_id
+        )
+        response = request.execute()
+        items = response.get("items", [])
+        if not items:
+            return None
+        return items[0]["snippet"]["title"]
+    except HttpError:
+        return None
+
+# -----------------------------
+# 3. 자막(Transcript) 가져오기
+# -----------------------------
+def get_video_transcript(video_id: str):
+    """
+    가능한 경우:
+      - 한국어 자막 우선 (ko)
+      - 없으면 영어(en)
+      - 그것도 없으면 에러
+    """
+    try:
+        # 자막 리스트 확인
+        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+
+        # 한국어 자막 우선
+        try:
+            transcript = transcript_list.find_transcript(['ko'])
+        except NoTranscriptFound:
+            # 영어 자막 시도
+            transcript = transcript_list.find_transcript(['en'])
+
+        fetched = transcript.fetch()
+        # 텍스트만 이어붙이기
+        full_text = " ".join([item["text"] for item in fetched])
+        return full_text
+
+    except TranscriptsDisabled:
+        raise RuntimeError("이 영상은 자막(Transcript)이 비활성화되어 있습니다.")
+    except NoTranscriptFound:
+        raise RuntimeError("해당 영상에서 사용할 수 있는 자막을 찾을 수 없습니다. (ko/en 없음)")
+    except Exception as e:
+        raise RuntimeError(f"자막을 가져오는 중 오류가 발생했습니다: {e}")
+
+# -----------------------------
+# 4. OpenAI를 사용해서 요약 생성
+# -----------------------------
+def summarize_with_openai(api_key: str, transcript: str, video_title: str | None = None):
+    client = OpenAI(api_key=api_key)
+
+    # 너무 긴 transcript는 잘라서 사용 (토큰 비용 줄이기)
+    max_chars = 8000
+    if len(transcript) > max_chars:
+        transcript = transcript[:max_chars]
+
+    system_prompt = "당신은 한국어로 설명을 잘하는 교사입니다. 중학생에게 설명한다는 느낌으로, 친절하고 명확하게 정리해 주세요."
+
+    user_prompt = f"""
+다음은 유튜브 영상의 자막 내용입니다. (필요하면 제목도 참고하세요)
+
+[영상 제목]
+{video_title or "제목 정보 없음"}
+
+[자막 내용]
+{transcript}
+
+이 내용을 바탕으로 아래 형식으로 한국어로 답변해 주세요.
+
+1. ✏️ 핵심 문장 (가장 중요한 문장 3~5개, 번호 매겨서)
+2. 📌 3줄 요약 (딱 3개의 문장으로)
+3. 🧷 핵심 키워드 (쉼표로 구분해서 5~10개)
+4. ❓ 이해한 내용 점검 질문 (중학생 수준의 확인 질문 5개, 번호 매겨서)
+
+형식 예시는 아래와 같아요:
+
+1. ✏️ 핵심 문장
+1) ...
+2) ...
+3) ...
+
+2. 📌 3줄 요약
+- ...
+- ...
+- ...
+
+3. 🧷 핵심 키워드
+키워드: 키워드1, 키워드2, 키워드3, ...
+
+4. ❓ 이해한 내용 점검 질문
+1) ...
+2) ...
+3) ...
+4) ...
+5) ...
+"""
+
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        temperature=0.5,
+    )
+
+    return response.choices[0].message.content
+
+# -----------------------------
+# 5. 워드클라우드 단어 빈도
+# -----------------------------
+# 기본 불용어 목록
+DEFAULT_STOPWORDS = {
+    "영상", "진짜", "그냥", "ㅋㅋㅋㅋ", "ㅋㅋㅋ", "ㅋㅋ",
+    "그거", "이거", "님", "아니", "근데", "그리고"
+}
+# 워드클라우드 페이지의 "제외하고 싶은 단어" 기본값
+DEFAULT_USER_STOPWORDS = "ㅋㅋㅋㅋ, ㅋㅋ, 진짜, 그냥, 영상, 사람, 그거"
+
+
+def parse_stopwords(user_stopwords):
+    # 사용자 입력 불용어 정리 + 기본 불용어 합치기
+    custom_words = set(w.strip() for w in user_stopwords.split(",") if w.strip())
+    return DEFAULT_STOPWORDS.union(custom_words)
+
+
+def wordcloud_frequencies(comments, stopwords):
+    """
+    댓글 텍스트 목록을 전처리하고 {단어: 빈도} dict로 돌려줍니다.
+    WordCloud.generate_from_frequencies()에 그대로 넘길 수 있습니다.
+    """
+    text = " ".join(comments)
+
+    # 정규식으로 특수문자/이모지 제거
+    text = re.sub(r"[^가-힣A-Za-z0-9\s]", " ", text)
+
+    # 불용어 제거 수행
+    for sw in stopwords:
+        text = text.replace(sw, " ")
+
+    return WordCloud().process_text(text)
+
+# -----------------------------
+# 6. 썸네일 이미지
+# -----------------------------
+def get_video_thumbnail(video_id):
+    # 최대 해상도 썸네일 URL
+    return f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
+
+
+def download_thumbnail(video_id):
+    response = requests.get(get_video_thumbnail(video_id), timeout=10)
+    if response.status_code != 200:
+        return None
+    return response.content